@@ -1,10 +1,11 @@
 """Configuration loading and validation"""
 import os
-from typing import List, Optional
+import sys
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
 from .utils.logger import setup_logger
-from .utils.team_loader import parse_ics_links_file
+from .utils.team_loader import build_ics_url, parse_ics_links_file
 
 logger = setup_logger(__name__)
 
@@ -12,9 +13,28 @@ logger = setup_logger(__name__)
 load_dotenv()
 
 
+def _parse_list(value: str) -> List[str]:
+    """Split a comma-separated env var into stripped, interned, non-empty items"""
+    return [sys.intern(item) for item in map(str.strip, value.split(",")) if item]
+
+
 class Config:
     """Application configuration"""
     
+    __slots__ = (
+        "discord_bot_token",
+        "discord_channel_id",
+        "discord_mention_role_id",
+        "discord_mention_role_name",
+        "discord_ping_everyone",
+        "teams",
+        "notify_minutes_before",
+        "schedule_fetch_interval",
+        "ics_base_url",
+        "team_ids",
+        "team_ics_urls",
+    )
+    
     def __init__(self):
         """Load and validate configuration"""
         # Discord configuration
@@ -32,10 +52,7 @@ class Config:
             )
         
         # Team filtering
-        teams_str = os.getenv("TEAMS", "")
-        self.teams: Optional[List[str]] = None
-        if teams_str.strip():
-            self.teams = [team.strip() for team in teams_str.split(",") if team.strip()]
+        self.teams: Optional[List[str]] = _parse_list(os.getenv("TEAMS", "")) or None
         
         # Notification settings
         self.notify_minutes_before = int(os.getenv("NOTIFY_MINUTES_BEFORE", "15"))
@@ -49,21 +66,21 @@ class Config:
         
         # Team IDs for ICS feeds - can come from file or env var
         self.team_ids: Optional[List[str]] = None
+        self.team_ics_urls: Dict[str, str] = {}
         
         # Try loading from file first (configurable via TEAM_ICS_FILE)
         team_ics_file = os.getenv("TEAM_ICS_FILE", "ical_links.txt")
         file_team_ids = parse_ics_links_file(team_ics_file)
         
         # Also check for TEAM_IDS environment variable
-        team_ids_str = os.getenv("TEAM_IDS", "")
-        env_team_ids: List[str] = []
-        if team_ids_str.strip():
-            env_team_ids = [tid.strip() for tid in team_ids_str.split(",") if tid.strip()]
+        env_team_ids = _parse_list(os.getenv("TEAM_IDS", ""))
         
         # Merge file and env var team IDs (file takes precedence, but merge unique IDs)
         all_team_ids = list(file_team_ids)
+        seen = set(all_team_ids)
         for tid in env_team_ids:
-            if tid not in all_team_ids:
+            if tid not in seen:
+                seen.add(tid)
                 all_team_ids.append(tid)
         
         if all_team_ids:
@@ -74,6 +91,11 @@ class Config:
                 logger.info(f"Loaded {len(env_team_ids)} team ID(s) from TEAM_IDS environment variable")
             if file_team_ids and env_team_ids:
                 logger.info(f"Total unique team IDs: {len(self.team_ids)}")
+            
+            # Build feed URLs once so fetches don't rebuild them every interval
+            self.team_ics_urls = {
+                tid: build_ics_url(self.ics_base_url, tid) for tid in self.team_ids
+            }
         
         self._validate()
         logger.info("Configuration loaded successfully")
@@ -99,6 +121,13 @@ class Config:
         except ValueError:
             raise ValueError("DISCORD_CHANNEL_ID must be a numeric channel ID")
         
+        # Team IDs become part of the feed URL path
+        for tid in self.team_ids or []:
+            if "/" in tid or any(char.isspace() for char in tid):
+                raise ValueError(
+                    f"Invalid team ID '{tid}': must not contain '/' or whitespace"
+                )
+        
         logger.info(f"Notification lead time: {self.notify_minutes_before} minutes")
         logger.info(f"Schedule fetch interval: {self.schedule_fetch_interval} minutes")
         if self.teams:
@@ -1,32 +1,73 @@
 """Main entry point for CDL Discord Bot"""
 import asyncio
+import hashlib
 import signal
 import sys
+from datetime import timedelta
 from pathlib import Path
+from typing import Optional
 
 from .config import Config
 from .storage.database import Database
-from .services.ics_parser import ICSParser
-from .services.schedule_fetcher import ScheduleFetcher
 from .services.match_service import MatchService
-from .services.discord_client import DiscordClient
-from .services.notification_service import NotificationService
 from .utils.logger import setup_logger
+from .utils.timezone import now_utc
 
 logger = setup_logger(__name__)
 
+# Maximum number of ICS feeds fetched at the same time
+ICS_FETCH_CONCURRENCY = 8
+
+# Seconds to wait for the Discord connection before starting services
+DISCORD_READY_TIMEOUT = 30
+
+# How often old matches and notifications are pruned from the database
+PRUNE_INTERVAL = timedelta(days=1)
+
 
 class CDLBot:
     """Main bot orchestrator"""
     
+    __slots__ = (
+        "config",
+        "database",
+        "running",
+        "_stop_event",
+        "_loop",
+        "_last_digest",
+        "_last_prune",
+        "ics_parser",
+        "_fetch_semaphore",
+        "schedule_fetcher",
+        "match_service",
+        "discord_client",
+        "notification_service",
+    )
+    
     def __init__(self):
         """Initialize bot components"""
+        # Imported here so loading Config alone doesn't pull in discord.py,
+        # icalendar, requests and BeautifulSoup
+        from .services.ics_parser import ICSParser
+        from .services.schedule_fetcher import ScheduleFetcher
+        from .services.discord_client import DiscordClient
+        from .services.notification_service import NotificationService
+        
         self.config = Config()
         self.database = Database(db_path="data/bot.db")
         self.running = False
+        self._stop_event = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._last_digest: Optional[bytes] = None
+        self._last_prune = self.database.get_last_prune_time()
         
         # Initialize services
-        self.ics_parser = ICSParser(self.config.ics_base_url)
+        self.ics_parser = ICSParser(
+            self.config.ics_base_url,
+            max_connections=ICS_FETCH_CONCURRENCY,
+            feed_urls=self.config.team_ics_urls
+        )
+        self._fetch_semaphore = asyncio.Semaphore(ICS_FETCH_CONCURRENCY)
         self.schedule_fetcher = ScheduleFetcher()
         self.match_service = MatchService(self.config.teams)
         self.discord_client = DiscordClient(
@@ -51,20 +92,32 @@ class CDLBot:
         """Handle shutdown signals"""
         logger.info(f"Received signal {signum}, shutting down gracefully...")
         self.running = False
+        # Wake the event loop so anything waiting on the stop event returns now
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
     
     async def start(self):
         """Start the bot"""
         self.running = True
+        self._loop = asyncio.get_running_loop()
         logger.info("Starting CDL Discord Bot...")
         
-        # Prune old data on startup
-        self.database.prune_old_data(days=30)
+        # Prune old data on startup if it hasn't been done recently
+        self._prune_if_due()
         
         # Start Discord client in background
         discord_task = asyncio.create_task(self.discord_client.start())
         
-        # Wait a bit for Discord to connect
-        await asyncio.sleep(2)
+        # Wait for Discord to connect before notifications start
+        try:
+            await asyncio.wait_for(
+                self.discord_client.ready.wait(), timeout=DISCORD_READY_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Discord not ready after %d seconds, starting services anyway",
+                DISCORD_READY_TIMEOUT
+            )
         
         # Start notification service
         notification_task = asyncio.create_task(self.notification_service.start())
@@ -74,8 +127,7 @@ class CDLBot:
         
         try:
             # Run until stopped
-            while self.running:
-                await asyncio.sleep(1)
+            await self._stop_event.wait()
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
         finally:
@@ -89,6 +141,8 @@ class CDLBot:
             await self.discord_client.close()
             discord_task.cancel()
             
+            self.database.close()
+            
             logger.info("Bot stopped")
     
     async def _schedule_fetch_loop(self):
@@ -101,41 +155,73 @@ class CDLBot:
         # Then fetch on interval
         while self.running:
             try:
-                await asyncio.sleep(self.config.schedule_fetch_interval * 60)
-                if self.running:
-                    await self._fetch_and_process_schedules()
+                if await self._wait_for_stop(self.config.schedule_fetch_interval * 60):
+                    break
+                await self._fetch_and_process_schedules()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in schedule fetch loop: {e}")
     
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """
+        Wait up to timeout seconds for shutdown
+        
+        Returns:
+            True if the bot is stopping
+        """
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        return not self.running
+    
     async def _fetch_and_process_schedules(self):
         """Fetch schedules from all sources and process them"""
+        # Prune old data periodically
+        self._prune_if_due()
+        
         logger.info("Fetching schedules...")
         all_matches = []
         
-        # Fetch from ICS feeds
+        # Fetch ICS feeds and the schedule page concurrently; the schedule
+        # page fetch is blocking, so it runs in a worker thread
         # Note: For now, we'll need team IDs. This could be expanded
         # to discover all team feeds or use a mapping
-        ics_matches = await self._fetch_ics_feeds()
-        all_matches.extend(ics_matches)
+        ics_matches, schedule_matches = await asyncio.gather(
+            self._fetch_ics_feeds(),
+            asyncio.to_thread(self.schedule_fetcher.fetch_schedule),
+            return_exceptions=True
+        )
         
-        # Fetch from schedule page
-        try:
-            schedule_matches = self.schedule_fetcher.fetch_schedule()
+        if isinstance(ics_matches, Exception):
+            logger.error("Error fetching ICS feeds: %s", ics_matches)
+        else:
+            all_matches.extend(ics_matches)
+        
+        if isinstance(schedule_matches, Exception):
+            logger.error("Error fetching schedule page: %s", schedule_matches)
+        else:
             all_matches.extend(schedule_matches)
-        except Exception as e:
-            logger.error(f"Error fetching schedule page: {e}")
         
         # Process and store matches
         if all_matches:
+            # Skip normalization and storage when nothing changed since last run
+            digest = self._digest_matches(all_matches)
+            if digest == self._last_digest:
+                logger.info("No schedule changes across %d fetched matches", len(all_matches))
+                return
+            
             normalized = self.match_service.normalize_matches(all_matches)
             
-            # Store in database
-            for match in normalized:
-                self.database.upsert_match(match)
+            # Store in database in a single transaction
+            self.database.upsert_matches(normalized)
+            self._last_digest = digest
             
-            logger.info(f"Processed and stored {len(normalized)} matches")
+            # Let the notifier re-plan its sleep around the new schedule
+            self.notification_service.wake()
+            
+            logger.info("Processed and stored %d matches", len(normalized))
         else:
             logger.warning("No matches found from any source")
             if not self.config.team_ids:
@@ -143,9 +229,28 @@ class CDLBot:
                     "This is likely because no team IDs are configured. "
                     "See previous messages for configuration instructions."
                 )
+    
+    def _prune_if_due(self):
+        """Prune old data if PRUNE_INTERVAL has passed since the last prune"""
+        now = now_utc()
+        if self._last_prune is not None and now - self._last_prune < PRUNE_INTERVAL:
+            return
         
-        # Prune old data periodically
         self.database.prune_old_data(days=30)
+        self._last_prune = now
+    
+    @staticmethod
+    def _digest_matches(matches: list) -> bytes:
+        """Fingerprint fetched matches, ignoring when each one was parsed"""
+        digest = hashlib.blake2b(digest_size=16)
+        for fields in sorted(
+            (m.id, m.home_team, m.away_team, m.start_time_utc.isoformat(),
+             m.source, m.url or "", m.description or "")
+            for m in matches
+        ):
+            digest.update("\x1f".join(fields).encode())
+            digest.update(b"\x1e")
+        return digest.digest()
     
     async def _fetch_ics_feeds(self) -> list:
         """Fetch matches from ICS feeds"""
@@ -164,21 +269,35 @@ class CDLBot:
             )
             return matches
         
-        logger.info(f"Fetching ICS feeds for {len(team_ids)} team(s)")
+        logger.info("Fetching ICS feeds for %d team(s)", len(team_ids))
         
-        for team_id in team_ids:
-            try:
-                ics_content = self.ics_parser.fetch_ics(team_id)
-                if ics_content:
-                    parsed = self.ics_parser.parse_ics(ics_content, source="ics")
-                    matches.extend(parsed)
-                    logger.debug(f"Fetched {len(parsed)} matches from team {team_id}")
-                else:
-                    logger.warning(f"Failed to fetch ICS feed for team {team_id}")
-            except Exception as e:
-                logger.error(f"Error fetching ICS feed for team {team_id}: {e}")
+        # Fetch all feeds concurrently so the wall time is bounded by the
+        # slowest feed rather than the sum of all round-trips
+        results = await asyncio.gather(
+            *(self._fetch_ics_feed(team_id) for team_id in team_ids),
+            return_exceptions=True
+        )
+        
+        for team_id, result in zip(team_ids, results):
+            if isinstance(result, Exception):
+                logger.error("Error fetching ICS feed for team %s: %s", team_id, result)
+            else:
+                matches.extend(result)
         
         return matches
+    
+    async def _fetch_ics_feed(self, team_id: str) -> list:
+        """Fetch and parse the ICS feed for a single team"""
+        # Both the HTTP request and the icalendar parse are blocking, so run
+        # them in a worker thread to keep the Discord heartbeat responsive
+        async with self._fetch_semaphore:
+            parsed = await asyncio.to_thread(self.ics_parser.fetch_matches, team_id, "ics")
+        if parsed is None:
+            logger.warning("Failed to fetch ICS feed for team %s", team_id)
+            return []
+        
+        logger.debug("Fetched %d matches from team %s", len(parsed), team_id)
+        return parsed
 
 
 async def main():
@@ -1,7 +1,7 @@
 """Discord bot client for sending notifications"""
 import asyncio
 from datetime import datetime
-from typing import Optional
+from typing import Awaitable, Callable, List, Optional, Tuple
 import discord
 from discord.ext import commands
 
@@ -10,10 +10,35 @@ from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Discord's maximum message length in characters
+MAX_MESSAGE_LENGTH = 2000
+
+# Seconds to wait for the connection when used as an async context manager
+READY_TIMEOUT = 30
+
+# Seconds to wait for the connection task to finish after closing
+CLOSE_TIMEOUT = 5
+
 
 class DiscordClient:
     """Discord bot client for notifications"""
     
+    __slots__ = (
+        "token",
+        "channel_id",
+        "mention_role_id",
+        "mention_role_name",
+        "ping_everyone",
+        "_mention_prefix",
+        "_template",
+        "_channel",
+        "_can_send",
+        "_roles_by_name",
+        "ready",
+        "_task",
+        "bot",
+    )
+    
     def __init__(
         self,
         token: str,
@@ -37,6 +62,21 @@ class DiscordClient:
         self.mention_role_id = int(mention_role_id) if mention_role_id else None
         self.mention_role_name = mention_role_name
         self.ping_everyone = ping_everyone
+        self._build_template()
+        
+        # Channel handle and send permission, resolved on first use and
+        # invalidated when channel or role state changes
+        self._channel = None
+        self._can_send = False
+        
+        # Casefolded role name -> role for the channel's guild, built on demand
+        self._roles_by_name = None
+        
+        # Set once the bot has connected and its cache is populated
+        self.ready = asyncio.Event()
+        
+        # Connection task started by __aenter__
+        self._task: Optional[asyncio.Task] = None
         
         intents = discord.Intents.default()
         self.bot = commands.Bot(command_prefix='!', intents=intents)
@@ -50,9 +90,55 @@ class DiscordClient:
             logger.info(f"Discord bot logged in as {self.bot.user}")
             logger.info(f"Bot is ready, monitoring channel {self.channel_id}")
             
+            self._invalidate_channel()
+            
             # Resolve role name to ID if provided and role_id not already set
             if self.mention_role_name and not self.mention_role_id:
                 await self._resolve_role_name()
+            
+            self.ready.set()
+        
+        @self.bot.event
+        async def on_guild_channel_update(before, after):
+            if after.id == self.channel_id:
+                self._invalidate_channel()
+        
+        @self.bot.event
+        async def on_guild_role_create(role):
+            self._roles_by_name = None
+        
+        @self.bot.event
+        async def on_guild_role_delete(role):
+            self._roles_by_name = None
+            self._invalidate_channel()
+        
+        @self.bot.event
+        async def on_guild_role_update(before, after):
+            self._roles_by_name = None
+            self._invalidate_channel()
+    
+    def _invalidate_channel(self):
+        """Drop the cached channel handle so it is resolved again on next send"""
+        self._channel = None
+        self._can_send = False
+    
+    def _get_channel(self):
+        """
+        Get the notification channel, resolving and caching it on first use
+        
+        Only a granted send permission is cached; a denial is checked again
+        on every send so the bot recovers as soon as permissions are fixed,
+        even when no invalidating event is dispatched.
+        
+        Returns:
+            Channel object, or None if the channel is not visible to the bot
+        """
+        if self._channel is None or not self._can_send:
+            channel = self._channel or self.bot.get_channel(self.channel_id)
+            if channel:
+                self._channel = channel
+                self._can_send = channel.permissions_for(channel.guild.me).send_messages
+        return self._channel
     
     async def start(self):
         """Start the Discord bot"""
@@ -62,6 +148,44 @@ class DiscordClient:
         """Close the Discord bot connection"""
         await self.bot.close()
     
+    async def __aenter__(self) -> "DiscordClient":
+        """
+        Connect in the background and wait until the bot is ready
+        
+        Raises:
+            asyncio.TimeoutError: If the bot isn't ready within READY_TIMEOUT
+            Exception: Whatever start() raised if the connection failed
+        """
+        task = self._task = asyncio.create_task(self.start())
+        ready_task = asyncio.create_task(self.ready.wait())
+        done, _ = await asyncio.wait(
+            (task, ready_task),
+            timeout=READY_TIMEOUT,
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        
+        if ready_task not in done:
+            ready_task.cancel()
+            await self.__aexit__(None, None, None)
+            if task in done and task.exception():
+                raise task.exception()
+            raise asyncio.TimeoutError(f"Discord not ready after {READY_TIMEOUT} seconds")
+        
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the connection and wait for the connection task to finish"""
+        await self.close()
+        
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        try:
+            await asyncio.wait_for(task, timeout=CLOSE_TIMEOUT)
+        except asyncio.TimeoutError:
+            # wait_for has cancelled the task
+            pass
+    
     async def _resolve_role_name(self):
         """
         Resolve role name to role ID by searching in the guild
@@ -85,11 +209,18 @@ class DiscordClient:
                 )
                 return
             
-            # Search for role by name (case-insensitive)
-            role = discord.utils.get(guild.roles, name=self.mention_role_name)
+            # Search for role by name (case-insensitive). Built in reverse so the
+            # first role with a given name wins, like a linear search would.
+            if self._roles_by_name is None:
+                self._roles_by_name = {
+                    guild_role.name.casefold(): guild_role
+                    for guild_role in reversed(guild.roles)
+                }
+            role = self._roles_by_name.get(self.mention_role_name.casefold())
             
             if role:
                 self.mention_role_id = role.id
+                self._build_template()
                 logger.info(
                     f"Resolved role name '{self.mention_role_name}' to role ID {role.id}"
                 )
@@ -112,40 +243,130 @@ class DiscordClient:
         Returns:
             True if notification was sent successfully
         """
+        success = await self._send_message(self._format_message(match))
+        if success:
+            logger.info(
+                "Sent notification for %s vs %s to channel %s",
+                match.home_team, match.away_team, self.channel_id
+            )
+        return success
+    
+    async def send_many(self, matches: List[Match], max_retries: int = 3) -> List[Match]:
+        """
+        Send notifications for several matches using as few messages as possible
+        
+        Match notifications are packed into messages under Discord's length
+        limit, with the mention prefix included once per message. Each
+        message is retried with exponential backoff like send_with_retry.
+        
+        Args:
+            matches: Matches to notify about
+            max_retries: Maximum number of retry attempts per message
+        
+        Returns:
+            Matches whose notification was sent successfully
+        """
+        sent: List[Match] = []
+        
+        for batch in self._pack_notifications(matches):
+            message = self._mention_prefix + "\n\n".join(body for _, body in batch)
+            success = await self._retry(lambda: self._send_message(message), max_retries)
+            if success:
+                sent.extend(match for match, _ in batch)
+                logger.info("Sent %d notification(s) to channel %s", len(batch), self.channel_id)
+        
+        return sent
+    
+    def _pack_notifications(self, matches: List[Match]) -> List[List[Tuple[Match, str]]]:
+        """
+        Group formatted match notifications into batches that fit in one message
+        
+        Args:
+            matches: Matches to notify about
+        
+        Returns:
+            List of batches of (match, formatted body) pairs
+        """
+        batches: List[List[Tuple[Match, str]]] = []
+        batch: List[Tuple[Match, str]] = []
+        length = len(self._mention_prefix)
+        
+        for match in matches:
+            body = self._format_body(match)
+            # Bodies are separated by a blank line within a message
+            added = len(body) + (2 if batch else 0)
+            if batch and length + added > MAX_MESSAGE_LENGTH:
+                batches.append(batch)
+                batch = []
+                length = len(self._mention_prefix)
+                added = len(body)
+            batch.append((match, body))
+            length += added
+        
+        if batch:
+            batches.append(batch)
+        
+        return batches
+    
+    async def _send_message(self, message: str) -> bool:
+        """
+        Send a message to the notification channel
+        
+        Args:
+            message: Message content
+        
+        Returns:
+            True if the message was sent successfully
+        """
         try:
-            channel = self.bot.get_channel(self.channel_id)
+            channel = self._get_channel()
             if not channel:
-                logger.error(f"Channel {self.channel_id} not found")
+                logger.error("Channel %s not found", self.channel_id)
                 logger.error("Make sure the bot is in the server and the channel ID is correct")
                 return False
             
             # Check if bot has permission to send messages
-            if not channel.permissions_for(channel.guild.me).send_messages:
-                logger.error(f"Bot lacks permission to send messages in channel {self.channel_id}")
+            if not self._can_send:
+                logger.error("Bot lacks permission to send messages in channel %s", self.channel_id)
                 logger.error("Please ensure the bot has 'Send Messages' permission in this channel")
                 return False
             
-            message = self._format_message(match)
             await channel.send(message)
-            
-            logger.info(
-                f"Sent notification for {match.home_team} vs {match.away_team} "
-                f"to channel {self.channel_id}"
-            )
             return True
         
         except discord.errors.Forbidden as e:
-            logger.error(f"Permission denied: {e}")
+            self._invalidate_channel()
+            logger.error("Permission denied: %s", e)
             logger.error("The bot needs 'Send Messages' permission in the channel.")
             logger.error("Check the channel permissions and ensure the bot role has access.")
             return False
         except discord.errors.HTTPException as e:
-            logger.error(f"Discord API error sending notification: {e}")
+            logger.error("Discord API error sending notification: %s", e)
             return False
         except Exception as e:
-            logger.error(f"Error sending notification: {e}")
+            logger.error("Error sending notification: %s", e)
             return False
     
+    def _build_template(self):
+        """
+        Precompute the notification message template
+        
+        The mention prefix and header only change when the mention role is
+        resolved, so they are built once instead of for every notification.
+        """
+        mentions = []
+        if self.ping_everyone:
+            mentions.append("@everyone")
+        if self.mention_role_id:
+            mentions.append(f"<@&{self.mention_role_id}>")
+        
+        self._mention_prefix = " ".join(mentions) + "\n" if mentions else ""
+        self._template = (
+            "🔔 **CDL Match Starting Soon!**\n"
+            "{home} vs {away}\n"
+            "Start time: <t:{ts}:F> (<t:{ts}:R>)"
+        )
+    
     def _format_message(self, match: Match) -> str:
         """
         Format notification message
@@ -156,33 +377,30 @@ class DiscordClient:
         Returns:
             Formatted message string
         """
-        # Convert datetime to Unix timestamp for Discord timestamps
-        timestamp = int(match.start_time_utc.timestamp())
+        return self._mention_prefix + self._format_body(match)
+    
+    def _format_body(self, match: Match) -> str:
+        """
+        Format the notification text for a match, without mentions
         
-        # Build message
-        lines = [
-            "🔔 **CDL Match Starting Soon!**",
-            f"{match.home_team} vs {match.away_team}",
-            f"Start time: <t:{timestamp}:F> (<t:{timestamp}:R>)"
-        ]
+        Args:
+            match: Match object
+        
+        Returns:
+            Formatted notification text
+        """
+        # Convert datetime to Unix timestamp for Discord timestamps
+        body = self._template.format_map({
+            "home": match.home_team,
+            "away": match.away_team,
+            "ts": int(match.start_time_utc.timestamp())
+        })
         
         # Add URL if available
         if match.url:
-            lines.append(f"More info: {match.url}")
-        
-        message = "\n".join(lines)
-        
-        # Add mentions
-        mentions = []
-        if self.ping_everyone:
-            mentions.append("@everyone")
-        if self.mention_role_id:
-            mentions.append(f"<@&{self.mention_role_id}>")
-        
-        if mentions:
-            message = " ".join(mentions) + "\n" + message
+            body += f"\nMore info: {match.url}"
         
-        return message
+        return body
     
     async def send_with_retry(self, match: Match, max_retries: int = 3) -> bool:
         """
@@ -195,16 +413,28 @@ class DiscordClient:
         Returns:
             True if notification was sent successfully
         """
+        return await self._retry(lambda: self.send_notification(match), max_retries)
+    
+    async def _retry(self, send: Callable[[], Awaitable[bool]], max_retries: int) -> bool:
+        """
+        Call a send function with exponential backoff retry
+        
+        Args:
+            send: Coroutine function returning True on success
+            max_retries: Maximum number of retry attempts
+        
+        Returns:
+            True if the send eventually succeeded
+        """
         for attempt in range(max_retries):
-            success = await self.send_notification(match)
+            success = await send()
             if success:
                 return True
             
             if attempt < max_retries - 1:
                 wait_time = 2 ** attempt  # Exponential backoff
-                logger.info(f"Retrying notification in {wait_time} seconds...")
+                logger.info("Retrying notification in %d seconds...", wait_time)
                 await asyncio.sleep(wait_time)
         
-        logger.error(f"Failed to send notification after {max_retries} attempts")
+        logger.error("Failed to send notification after %d attempts", max_retries)
         return False
-
@@ -1,29 +1,140 @@
 """ICS feed parser for CDL team schedules"""
-import hashlib
 import re
+import sys
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from icalendar import Calendar
 
 from ..storage.models import Match
 from ..utils.logger import setup_logger
-from ..utils.timezone import to_utc
+from ..utils.match_id import generate_match_id
+from ..utils.team_loader import build_ics_url
+from ..utils.timezone import now_utc, to_utc
 
 logger = setup_logger(__name__)
 
+# Separator between team names in an event SUMMARY, e.g. "Team A vs Team B"
+_TEAM_SEPARATOR_RE = re.compile(r'\s+(?:vs|v|@)\s+', re.IGNORECASE)
+
+# Leading "vs" left on a team name by some summary formats
+_VS_PREFIX_RE = re.compile(r'^vs\s+', re.IGNORECASE)
+
+# VEVENT properties read by the streaming parser
+_EVENT_FIELDS = frozenset(("DTSTART", "SUMMARY", "URL", "DESCRIPTION"))
+
+# RFC 5545 TEXT escapes
+_TEXT_ESCAPE_RE = re.compile(r'\\([\\;,nN])')
+_TEXT_UNESCAPES = {"\\": "\\", ";": ";", ",": ",", "n": "\n", "N": "\n"}
+
+
+def _strip_team_name(part: str) -> str:
+    """Strip whitespace and any leading "vs" from one side of a SUMMARY"""
+    part = part.strip()
+    # Most names don't start with "v", so skip the regex for them
+    if part[:1] in ("v", "V"):
+        part = _VS_PREFIX_RE.sub('', part).strip()
+    return part
+
+
+def _unescape_text(value: str) -> str:
+    """Unescape an iCalendar TEXT value"""
+    if "\\" not in value:
+        return value
+    return _TEXT_ESCAPE_RE.sub(lambda m: _TEXT_UNESCAPES[m.group(1)], value)
+
+
+def _parse_dtstart(params: str, value: str) -> Tuple[datetime, Optional[str]]:
+    """
+    Parse a raw DTSTART property
+    
+    Args:
+        params: Property parameters, e.g. "TZID=America/New_York"
+        value: Property value, e.g. "20260125T190000"
+    
+    Returns:
+        Tuple of (naive datetime, TZID or None). UTC ("Z") and floating
+        times return no TZID and are treated as UTC.
+    
+    Raises:
+        ValueError: If the value isn't a DATE or DATE-TIME
+    """
+    tz = None
+    for param in params.split(";") if params else ():
+        key, _, param_value = param.partition("=")
+        if key.upper() == "TZID":
+            tz = param_value
+    
+    if len(value) == 8:
+        # Date-only (all-day event)
+        return datetime.strptime(value, "%Y%m%d"), None
+    if value.endswith("Z"):
+        return datetime.strptime(value, "%Y%m%dT%H%M%SZ"), None
+    return datetime.strptime(value, "%Y%m%dT%H%M%S"), tz
+
 
 class ICSParser:
     """Parser for ICS calendar feeds"""
     
-    def __init__(self, base_url: str):
+    def __init__(
+        self,
+        base_url: str,
+        max_connections: int = 8,
+        feed_urls: Optional[Dict[str, str]] = None
+    ):
         """
         Initialize ICS parser
         
         Args:
             base_url: Base URL for CDL ICS feeds
+            max_connections: Size of the pooled keep-alive connections per host
+            feed_urls: Optional precomputed team ID -> feed URL mapping
         """
         self.base_url = base_url.rstrip('/')
+        self.feed_urls = feed_urls or {}
+        
+        # Shared session so concurrent and periodic fetches reuse TLS connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # team_id -> (ETag, Last-Modified, parsed matches) from the last 200 response
+        self._cache: Dict[str, Tuple[Optional[str], Optional[str], List[Match]]] = {}
+    
+    def _feed_url(self, team_id: str) -> str:
+        """Get the ICS feed URL for a team, preferring the precomputed one"""
+        url = self.feed_urls.get(team_id)
+        if url is None:
+            url = build_ics_url(self.base_url, team_id)
+        return url
+    
+    def _get_feed(
+        self,
+        team_id: str,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[requests.Response]:
+        """
+        Request the ICS feed for a team over the shared session
+        
+        Args:
+            team_id: Team identifier (e.g., 'blt19237b20a0dd1b07')
+            headers: Optional extra request headers
+        
+        Returns:
+            Successful (2xx or 304) response, or None if the fetch failed
+        """
+        url = self._feed_url(team_id)
+        
+        try:
+            logger.debug("Fetching ICS feed: %s", url)
+            response = self.session.get(url, headers=headers, timeout=30)
+            response.raise_for_status()
+            return response
+        except requests.RequestException as e:
+            logger.error("Failed to fetch ICS feed %s: %s", url, e)
+            return None
     
     def fetch_ics(self, team_id: str) -> Optional[str]:
         """
@@ -35,25 +146,60 @@ class ICSParser:
         Returns:
             ICS content as string, or None if fetch failed
         """
-        url = f"{self.base_url}/{team_id}.ics"
+        response = self._get_feed(team_id)
+        return response.text if response is not None else None
+    
+    def fetch_matches(self, team_id: str, source: str = "ics") -> Optional[List[Match]]:
+        """
+        Fetch and parse the ICS feed for a team, reusing the previous parse
+        when the feed has not changed
         
-        # Convert webcal:// to https://
-        if url.startswith("webcal://"):
-            url = url.replace("webcal://", "https://", 1)
+        Sends If-None-Match / If-Modified-Since validators from the last
+        successful fetch; on HTTP 304 the memoized matches are returned
+        without downloading or parsing the feed again.
         
-        try:
-            logger.debug(f"Fetching ICS feed: {url}")
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            return response.text
-        except requests.RequestException as e:
-            logger.error(f"Failed to fetch ICS feed {url}: {e}")
+        Args:
+            team_id: Team identifier (e.g., 'blt19237b20a0dd1b07')
+            source: Source identifier for matches
+        
+        Returns:
+            List of Match objects, or None if fetch failed
+        """
+        cached = self._cache.get(team_id)
+        
+        # Validators are echoed back exactly as the server sent them, so the
+        # Last-Modified date never needs to be parsed
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        response = self._get_feed(team_id, headers)
+        if response is None:
             return None
+        if response.status_code == 304 and cached:
+            logger.debug("ICS feed unchanged for team %s, reusing cached matches", team_id)
+            return list(cached[2])
+        
+        matches = self.parse_ics(response.text, source=source)
+        
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._cache[team_id] = (etag, last_modified, matches)
+        
+        return list(matches)
     
     def parse_ics(self, ics_content: str, source: str = "ics") -> List[Match]:
         """
         Parse ICS content and extract matches
         
+        Uses a streaming parser that only reads the VEVENT fields we need,
+        falling back to icalendar for content it doesn't understand.
+        
         Args:
             ics_content: ICS file content as string
             source: Source identifier for matches
@@ -61,6 +207,13 @@ class ICSParser:
         Returns:
             List of Match objects
         """
+        try:
+            matches = self._fast_parse_ics(ics_content, source)
+            logger.info("Parsed %d matches from ICS feed", len(matches))
+            return matches
+        except Exception as e:
+            logger.debug("Fast ICS parse failed, falling back to icalendar: %s", e)
+        
         matches = []
         
         try:
@@ -71,13 +224,102 @@ class ICSParser:
                 if match:
                     matches.append(match)
             
-            logger.info(f"Parsed {len(matches)} matches from ICS feed")
+            logger.info("Parsed %d matches from ICS feed", len(matches))
             return matches
         
         except Exception as e:
-            logger.error(f"Failed to parse ICS content: {e}")
+            logger.error("Failed to parse ICS content: %s", e)
             return []
     
+    def _fast_parse_ics(self, ics_content: str, source: str) -> List[Match]:
+        """
+        Parse matches by scanning ICS lines for DTSTART, SUMMARY, URL and DESCRIPTION
+        
+        This avoids building icalendar's full component tree. It raises
+        ValueError on anything it can't handle so the caller can fall back.
+        
+        Args:
+            ics_content: ICS file content as string
+            source: Source identifier for matches
+        
+        Returns:
+            List of Match objects
+        """
+        if "BEGIN:VCALENDAR" not in ics_content.upper():
+            raise ValueError("not an iCalendar document")
+        
+        # Unfold continuation lines (RFC 5545 section 3.1)
+        lines: List[str] = []
+        for line in ics_content.splitlines():
+            if line[:1] in (" ", "\t") and lines:
+                lines[-1] += line[1:]
+            else:
+                lines.append(line)
+        
+        matches = []
+        event: Optional[Dict[str, Tuple[str, str]]] = None
+        depth = 0  # Nesting of sub-components (e.g. VALARM) inside the VEVENT
+        
+        for line in lines:
+            # Component and property names are case-insensitive (RFC 5545)
+            head = line[:6].upper()
+            if head == "BEGIN:" and line[6:].upper() == "VEVENT":
+                event = {}
+                depth = 0
+            elif event is None:
+                continue
+            elif head == "BEGIN:":
+                depth += 1
+            elif head.startswith("END:"):
+                if depth:
+                    depth -= 1
+                    continue
+                if line[4:].upper() == "VEVENT":
+                    match = self._parse_event_fields(event, source)
+                    if match:
+                        matches.append(match)
+                    event = None
+            elif depth == 0:
+                name, sep, value = line.partition(":")
+                if not sep:
+                    continue
+                if '"' in name:
+                    # Quoted parameter values may contain ':'
+                    raise ValueError(f"quoted property parameters: {name}")
+                prop, _, params = name.partition(";")
+                prop = prop.upper()
+                if prop in _EVENT_FIELDS and prop not in event:
+                    event[prop] = (params, value)
+        
+        return matches
+    
+    def _parse_event_fields(
+        self,
+        event: Dict[str, Tuple[str, str]],
+        source: str
+    ) -> Optional[Match]:
+        """
+        Build a Match from VEVENT properties collected by _fast_parse_ics
+        
+        Args:
+            event: Property name -> (parameters, raw value)
+            source: Source identifier
+        
+        Returns:
+            Match object or None if the event has no start time or teams
+        """
+        if "DTSTART" not in event:
+            return None
+        
+        params, value = event["DTSTART"]
+        start_time, tz = _parse_dtstart(params, value)
+        
+        summary = _unescape_text(event.get("SUMMARY", ("", ""))[1])
+        url = event.get("URL", ("", ""))[1] or None
+        description = _unescape_text(event.get("DESCRIPTION", ("", ""))[1]) or None
+        
+        return self._build_match(to_utc(start_time, tz), summary, url, description, source)
+    
     def _parse_event(self, event, source: str) -> Optional[Match]:
         """
         Parse a single VEVENT into a Match object
@@ -102,39 +344,61 @@ class ICSParser:
                 # Handle date-only (all-day events)
                 start_time = datetime.combine(dtstart.dt, datetime.min.time())
             
-            # Convert to UTC
-            start_time_utc = to_utc(start_time)
-            
             # Extract summary (team names)
             summary = str(event.get('SUMMARY', ''))
-            home_team, away_team = self._parse_teams_from_summary(summary)
-            
-            if not home_team or not away_team:
-                logger.warning(f"Could not parse teams from summary: {summary}")
-                return None
             
             # Extract optional fields
             url = str(event.get('URL', '')) if event.get('URL') else None
             description = str(event.get('DESCRIPTION', '')) if event.get('DESCRIPTION') else None
             
-            # Generate match ID
-            match_id = self._generate_match_id(home_team, away_team, start_time_utc)
-            
-            return Match(
-                id=match_id,
-                home_team=home_team,
-                away_team=away_team,
-                start_time_utc=start_time_utc,
-                source=source,
-                created_at=datetime.utcnow(),
-                url=url,
-                description=description
-            )
+            return self._build_match(to_utc(start_time), summary, url, description, source)
         
         except Exception as e:
-            logger.error(f"Error parsing event: {e}")
+            logger.error("Error parsing event: %s", e)
             return None
     
+    def _build_match(
+        self,
+        start_time_utc: datetime,
+        summary: str,
+        url: Optional[str],
+        description: Optional[str],
+        source: str
+    ) -> Optional[Match]:
+        """
+        Build a Match from extracted event fields
+        
+        Args:
+            start_time_utc: Start time as naive UTC datetime
+            summary: SUMMARY field content
+            url: Optional event URL
+            description: Optional event description
+            source: Source identifier
+        
+        Returns:
+            Match object or None if teams can't be parsed from the summary
+        """
+        home_team, away_team = self._parse_teams_from_summary(summary)
+        
+        if not home_team or not away_team:
+            logger.warning("Could not parse teams from summary: %s", summary)
+            return None
+        
+        # Generate match ID
+        match_id = self._generate_match_id(home_team, away_team, start_time_utc)
+        
+        # Team names repeat across every match in a feed, so share one copy
+        return Match(
+            id=match_id,
+            home_team=sys.intern(home_team),
+            away_team=sys.intern(away_team),
+            start_time_utc=start_time_utc,
+            source=sys.intern(source),
+            created_at=now_utc(),
+            url=url,
+            description=description
+        )
+    
     def _parse_teams_from_summary(self, summary: str) -> Tuple[Optional[str], Optional[str]]:
         """
         Parse team names from ICS SUMMARY field
@@ -150,28 +414,16 @@ class ICSParser:
         Returns:
             Tuple of (home_team, away_team) or (None, None) if parsing fails
         """
-        # Common separators
-        separators = [' vs ', ' v ', ' @ ', ' VS ', ' V ', ' @ ']
-        
-        for sep in separators:
-            if sep in summary:
-                parts = summary.split(sep, 1)
-                if len(parts) == 2:
-                    home = parts[0].strip()
-                    away = parts[1].strip()
-                    # Remove common prefixes/suffixes
-                    home = re.sub(r'^vs\s+', '', home, flags=re.IGNORECASE).strip()
-                    away = re.sub(r'^vs\s+', '', away, flags=re.IGNORECASE).strip()
-                    return home, away
-        
-        # Try to find "vs" or "v" anywhere
-        match = re.search(r'(.+?)\s+(?:vs|v|@)\s+(.+)', summary, re.IGNORECASE)
-        if match:
-            return match.group(1).strip(), match.group(2).strip()
+        # Split on the first separator ("vs", "v" or "@", any case)
+        parts = _TEAM_SEPARATOR_RE.split(summary, maxsplit=1)
+        if len(parts) == 2:
+            # Remove common prefixes
+            return _strip_team_name(parts[0]), _strip_team_name(parts[1])
         
         return None, None
     
-    def _generate_match_id(self, home_team: str, away_team: str, start_time: datetime) -> str:
+    @staticmethod
+    def _generate_match_id(home_team: str, away_team: str, start_time: datetime) -> str:
         """
         Generate a unique match ID
         
@@ -183,19 +435,4 @@ class ICSParser:
         Returns:
             Unique match ID string
         """
-        # Normalize team names for ID generation
-        normalized_home = home_team.lower().strip()
-        normalized_away = away_team.lower().strip()
-        
-        # Use alphabetical order for consistent IDs regardless of home/away
-        team_pair = tuple(sorted([normalized_home, normalized_away]))
-        
-        # Include date (not time) for uniqueness
-        date_str = start_time.strftime("%Y-%m-%d")
-        
-        # Generate hash
-        content = f"{team_pair[0]}|{team_pair[1]}|{date_str}"
-        match_id = hashlib.md5(content.encode()).hexdigest()[:16]
-        
-        return f"match_{match_id}"
-
+        return generate_match_id(home_team, away_team, start_time)
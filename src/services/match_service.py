@@ -1,13 +1,45 @@
 """Match service for normalization, deduplication, and filtering"""
+import sys
 from datetime import datetime, timedelta
-from typing import List, Optional, Set, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 from difflib import SequenceMatcher
 
 from ..storage.models import Match
 from ..utils.logger import setup_logger
+from ..utils.match_id import generate_match_id
+from ..utils.timezone import now_utc
 
 logger = setup_logger(__name__)
 
+# Reference point for the hour buckets in dedup keys
+_EPOCH = datetime(1970, 1, 1)
+_ONE_HOUR = timedelta(hours=1)
+
+# Separator characters that shouldn't anchor a match between team names
+_NAME_JUNK = frozenset(" .-")
+
+
+@lru_cache(maxsize=4096)
+def _names_similar(name1: str, name2: str, threshold: float) -> bool:
+    """
+    Memoized sequence-matching similarity check
+    
+    Team names repeat across every match in a feed, so each distinct pair
+    is only scored once. Cheap upper bounds reject most non-matching pairs
+    before the full ratio(): first the length bound, then quick_ratio().
+    """
+    # Same bound as real_quick_ratio(), checked before building the matcher
+    total = len(name1) + len(name2)
+    if total and 2.0 * min(len(name1), len(name2)) / total < threshold:
+        return False
+    
+    matcher = SequenceMatcher(_NAME_JUNK.__contains__, name1, name2, autojunk=False)
+    return (
+        matcher.quick_ratio() >= threshold and
+        matcher.ratio() >= threshold
+    )
+
 
 class MatchService:
     """Service for match normalization and processing"""
@@ -27,6 +59,9 @@ class MatchService:
             ]
         else:
             self.teams_filter_normalized = None
+        
+        # Lowercased team name -> whether it matches any filter entry
+        self._filter_decisions: Dict[str, bool] = {}
     
     def normalize_matches(self, matches: List[Match]) -> List[Match]:
         """
@@ -55,15 +90,21 @@ class MatchService:
     
     def _normalize_match(self, match: Match) -> Match:
         """Normalize a single match (team names, times)"""
+        home_team = self._normalize_team_name(match.home_team)
+        away_team = self._normalize_team_name(match.away_team)
+        
+        # Lowercase once here so dedup and filtering can reuse it
         return Match(
             id=match.id,
-            home_team=self._normalize_team_name(match.home_team),
-            away_team=self._normalize_team_name(match.away_team),
+            home_team=home_team,
+            away_team=away_team,
             start_time_utc=match.start_time_utc,
             source=match.source,
             created_at=match.created_at,
             url=match.url,
-            description=match.description
+            description=match.description,
+            home_norm=sys.intern(home_team.lower()),
+            away_norm=sys.intern(away_team.lower())
         )
     
     def _normalize_team_name(self, team_name: str) -> str:
@@ -76,8 +117,14 @@ class MatchService:
         Returns:
             Normalized team name
         """
-        # Remove extra whitespace
-        normalized = ' '.join(team_name.split())
+        # Names from the feeds are usually clean already; isprintable() is
+        # False for tabs, newlines and other non-space whitespace
+        if (team_name.isprintable() and '  ' not in team_name and
+                team_name[:1] != ' ' and team_name[-1:] != ' '):
+            return team_name
+        
+        # Remove extra whitespace, sharing one copy of each distinct name
+        normalized = sys.intern(' '.join(team_name.split()))
         
         # Common team name variations
         # This could be expanded with a mapping if needed
@@ -97,7 +144,7 @@ class MatchService:
         Returns:
             Deduplicated list (keeps the most recent source)
         """
-        seen: Set[str] = set()
+        seen: Set[Tuple[str, str, int]] = set()
         unique_matches = []
         
         # Sort by created_at (most recent first) to prefer newer data
@@ -115,7 +162,7 @@ class MatchService:
         
         return unique_matches
     
-    def _get_dedup_key(self, match: Match) -> str:
+    def _get_dedup_key(self, match: Match) -> Tuple[str, str, int]:
         """
         Generate deduplication key for a match
         
@@ -123,18 +170,17 @@ class MatchService:
             match: Match object
         
         Returns:
-            Deduplication key string
+            Tuple of (first team, second team, hours since the epoch)
         """
         # Normalize team names (alphabetical order)
-        teams = tuple(sorted([
-            match.home_team.lower(),
-            match.away_team.lower()
-        ]))
+        home = match.home_norm or match.home_team.lower()
+        away = match.away_norm or match.away_team.lower()
+        first, second = (home, away) if home <= away else (away, home)
         
-        # Round start time to nearest hour for deduplication window
-        hour_rounded = match.start_time_utc.replace(minute=0, second=0, microsecond=0)
+        # Round start time down to the hour for deduplication window
+        hour = (match.start_time_utc - _EPOCH) // _ONE_HOUR
         
-        return f"{teams[0]}|{teams[1]}|{hour_rounded.isoformat()}"
+        return first, second, hour
     
     def _filter_by_teams(self, matches: List[Match]) -> List[Match]:
         """
@@ -149,23 +195,41 @@ class MatchService:
         filtered = []
         
         for match in matches:
-            home_normalized = self._normalize_team_name(match.home_team).lower()
-            away_normalized = self._normalize_team_name(match.away_team).lower()
-            
             # Check if either team matches any filter
+            if (self._team_matches_filter(match.home_norm) or
+                self._team_matches_filter(match.away_norm)):
+                filtered.append(match)
+        
+        logger.info(f"Filtered to {len(filtered)} matches for configured teams")
+        return filtered
+    
+    def _team_matches_filter(self, team_normalized: str) -> bool:
+        """
+        Check whether a lowercased team name matches any configured filter
+        
+        The decision is cached per name, so the filter list is only scanned
+        once for each distinct team rather than once per match.
+        
+        Args:
+            team_normalized: Normalized, lowercased team name
+        
+        Returns:
+            True if the team matches a filter entry
+        """
+        decision = self._filter_decisions.get(team_normalized)
+        if decision is None:
+            decision = False
             for filter_team in self.teams_filter_normalized:
                 filter_lower = filter_team.lower()
                 
                 # Exact match or partial match
-                if (filter_lower in home_normalized or 
-                    filter_lower in away_normalized or
-                    self._team_name_similar(home_normalized, filter_lower) or
-                    self._team_name_similar(away_normalized, filter_lower)):
-                    filtered.append(match)
+                if (filter_lower in team_normalized or
+                    self._team_name_similar(team_normalized, filter_lower)):
+                    decision = True
                     break
+            self._filter_decisions[team_normalized] = decision
         
-        logger.info(f"Filtered to {len(filtered)} matches for configured teams")
-        return filtered
+        return decision
     
     def _team_name_similar(self, name1: str, name2: str, threshold: float = 0.8) -> bool:
         """
@@ -179,8 +243,7 @@ class MatchService:
         Returns:
             True if names are similar enough
         """
-        ratio = SequenceMatcher(None, name1, name2).ratio()
-        return ratio >= threshold
+        return _names_similar(name1, name2, threshold)
     
     def update_match_time(self, match: Match, new_start_time: datetime) -> Match:
         """
@@ -194,9 +257,7 @@ class MatchService:
             Updated match with new ID
         """
         # Generate new ID with updated time
-        from ..services.ics_parser import ICSParser
-        parser = ICSParser("")
-        new_id = parser._generate_match_id(match.home_team, match.away_team, new_start_time)
+        new_id = generate_match_id(match.home_team, match.away_team, new_start_time)
         
         return Match(
             id=new_id,
@@ -204,7 +265,7 @@ class MatchService:
             away_team=match.away_team,
             start_time_utc=new_start_time,
             source=match.source,
-            created_at=datetime.utcnow(),
+            created_at=now_utc(),
             url=match.url,
             description=match.description
         )
@@ -1,10 +1,9 @@
 """Notification service for scheduling and sending match notifications"""
 import asyncio
-from datetime import datetime, timedelta
-from typing import List
+from datetime import timedelta
+from typing import Optional
 
 from ..storage.database import Database
-from ..storage.models import Match
 from ..services.discord_client import DiscordClient
 from ..utils.logger import setup_logger
 from ..utils.timezone import now_utc
@@ -29,18 +28,22 @@ class NotificationService:
             database: Database instance
             discord_client: Discord client instance
             notify_minutes_before: Minutes before match to send notification
-            check_interval: Seconds between notification checks
+            check_interval: Seconds between retries while a due notification
+                could not be sent
         """
         self.database = database
         self.discord_client = discord_client
         self.notify_minutes_before = notify_minutes_before
         self.check_interval = check_interval
         self.running = False
+        
+        # Set when new matches are stored so the loop re-plans its sleep
+        self._wakeup = asyncio.Event()
     
     async def start(self):
         """Start the notification checking loop"""
         self.running = True
-        logger.info(f"Starting notification service (check every {self.check_interval}s)")
+        logger.info("Starting notification service")
         
         while self.running:
             try:
@@ -48,11 +51,54 @@ class NotificationService:
             except Exception as e:
                 logger.error(f"Error in notification loop: {e}")
             
-            await asyncio.sleep(self.check_interval)
+            await self._sleep(self._seconds_until_next_check())
+    
+    def wake(self):
+        """Re-check for notifications now, e.g. after new matches are stored"""
+        self._wakeup.set()
+    
+    async def _sleep(self, timeout: Optional[float]):
+        """Sleep for timeout seconds (forever if None) or until woken"""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+    
+    def _seconds_until_next_check(self) -> Optional[float]:
+        """
+        Work out how long to sleep before the next notification check
+        
+        Sleeps until the next unnotified match enters its notification
+        window; newly stored matches wake the loop early via wake().
+        Matches already in the window (e.g. after a failed send) are retried
+        every check_interval.
+        
+        Returns:
+            Seconds to sleep, or None to sleep until woken
+        """
+        try:
+            now = now_utc()
+            next_start = self.database.next_notification_time(
+                now, str(self.discord_client.channel_id)
+            )
+        except Exception as e:
+            logger.error(f"Error finding next notification time: {e}")
+            return self.check_interval
+        
+        if next_start is None:
+            return None
+        
+        notify_at = next_start - timedelta(minutes=self.notify_minutes_before)
+        delay = (notify_at - now).total_seconds()
+        if delay <= 0:
+            return self.check_interval
+        return max(1, delay)
     
     def stop(self):
         """Stop the notification checking loop"""
         self.running = False
+        self._wakeup.set()
         logger.info("Stopping notification service")
     
     async def _check_and_notify(self):
@@ -64,55 +110,26 @@ class NotificationService:
         # So: start_time >= (now + notify_minutes_before)
         notification_deadline = now + timedelta(minutes=self.notify_minutes_before)
         
-        # Get matches that should be notified
-        # Matches where start_time - notify_minutes_before <= now < start_time
-        # This means: start_time >= now + notify_minutes_before AND start_time > now
-        matches_to_notify = self._get_matches_to_notify(now, notification_deadline)
+        # Get matches in the window that haven't been notified yet, in one query
+        # Matches where start_time - notify_minutes_before <= now <= start_time
+        # This means: now <= start_time <= now + notify_minutes_before
+        channel_id = str(self.discord_client.channel_id)
+        matches_to_notify = self.database.get_matches_to_notify(
+            now,
+            channel_id,
+            before_time=notification_deadline
+        )
         
         if not matches_to_notify:
             return
         
-        logger.info(f"Found {len(matches_to_notify)} matches to notify")
+        logger.info("Found %d matches to notify", len(matches_to_notify))
         
-        for match in matches_to_notify:
-            # Double-check we're in the notification window
-            notification_time = match.start_time_utc - timedelta(minutes=self.notify_minutes_before)
-            
-            if now >= notification_time and now < match.start_time_utc:
-                # Check if already notified
-                if not self.database.is_notified(match.id, self.discord_client.channel_id):
-                    success = await self.discord_client.send_with_retry(match)
-                    if success:
-                        self.database.mark_notified(match.id, self.discord_client.channel_id)
-                        logger.info(
-                            f"Notified about match: {match.home_team} vs {match.away_team} "
-                            f"(starts at {match.start_time_utc})"
-                        )
-    
-    def _get_matches_to_notify(self, now: datetime, deadline: datetime) -> List[Match]:
-        """
-        Get matches that should be notified
-        
-        Args:
-            now: Current time
-            deadline: Latest start time for matches to notify about
-        
-        Returns:
-            List of matches that need notification
-        """
-        # Get all matches that start between now and deadline
-        all_upcoming = self.database.get_upcoming_matches(deadline)
-        
-        # Filter to matches that haven't been notified yet
-        matches_to_notify = []
-        for match in all_upcoming:
-            # Only notify if we're past the notification time but before match start
-            notification_time = match.start_time_utc - timedelta(minutes=self.notify_minutes_before)
-            
-            if (now >= notification_time and 
-                now < match.start_time_utc and
-                not self.database.is_notified(match.id, self.discord_client.channel_id)):
-                matches_to_notify.append(match)
-        
-        return matches_to_notify
-
+        # Send all due notifications together so they share Discord messages
+        sent = await self.discord_client.send_many(matches_to_notify)
+        for match in sent:
+            self.database.mark_notified(match.id, channel_id)
+            logger.info(
+                "Notified about match: %s vs %s (starts at %s)",
+                match.home_team, match.away_team, match.start_time_utc
+            )
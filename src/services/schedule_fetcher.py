@@ -1,7 +1,7 @@
 """Schedule fetcher for CDL official schedule page"""
 import re
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import requests
 from bs4 import BeautifulSoup
 
@@ -11,6 +11,12 @@ from ..utils.timezone import to_utc
 
 logger = setup_logger(__name__)
 
+# Class names that mark match containers and their parts
+_CONTAINER_CLASS_RE = re.compile(r'match|schedule|game', re.I)
+_TEAM_TEXT_RE = re.compile(r'vs|v\.|@', re.I)
+_TEAM_CLASS_RE = re.compile(r'team|name', re.I)
+_TIME_CLASS_RE = re.compile(r'time|date|start', re.I)
+
 
 class ScheduleFetcher:
     """Fetcher for CDL official schedule page"""
@@ -23,24 +29,47 @@ class ScheduleFetcher:
             schedule_url: URL of the CDL schedule page
         """
         self.schedule_url = schedule_url
+        
+        # (ETag, Last-Modified, parsed matches) from the last 200 response
+        self._cache: Optional[Tuple[Optional[str], Optional[str], List[Match]]] = None
     
     def fetch_schedule(self) -> List[Match]:
         """
         Fetch and parse matches from the CDL schedule page
         
+        Sends conditional-GET validators from the last successful fetch and
+        reuses the previously parsed matches when the page is unchanged.
+        
         Returns:
             List of Match objects
         """
+        # Validators are echoed back exactly as the server sent them
+        headers = {}
+        if self._cache:
+            etag, last_modified, _ = self._cache
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
         try:
             logger.debug(f"Fetching schedule from {self.schedule_url}")
-            response = requests.get(self.schedule_url, timeout=30)
+            response = requests.get(self.schedule_url, headers=headers, timeout=30)
+            if response.status_code == 304 and self._cache:
+                logger.debug("Schedule page unchanged, reusing cached matches")
+                return list(self._cache[2])
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
             matches = self._parse_html(soup)
             
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self._cache = (etag, last_modified, matches)
+            
             logger.info(f"Parsed {len(matches)} matches from schedule page")
-            return matches
+            return list(matches)
         
         except requests.RequestException as e:
             logger.error(f"Failed to fetch schedule page: {e}")
@@ -68,12 +97,8 @@ class ScheduleFetcher:
         # Common patterns: match cards, schedule items, etc.
         # This is a placeholder - actual implementation depends on page structure
         
-        # Look for common match container patterns
-        match_containers = (
-            soup.find_all('div', class_=re.compile(r'match|schedule|game', re.I)) +
-            soup.find_all('article', class_=re.compile(r'match|schedule|game', re.I)) +
-            soup.find_all('li', class_=re.compile(r'match|schedule|game', re.I))
-        )
+        # Look for common match container patterns in a single pass
+        match_containers = soup.find_all(['div', 'article', 'li'], class_=_CONTAINER_CLASS_RE)
         
         if not match_containers:
             # Fallback: look for any elements with team names
@@ -91,13 +116,13 @@ class ScheduleFetcher:
         """Parse a single match container element"""
         try:
             # Extract team names
-            team_elements = container.find_all(text=re.compile(r'vs|v\.|@', re.I))
+            team_elements = container.find_all(text=_TEAM_TEXT_RE)
             if not team_elements:
                 # Try finding team name elements
-                team_elements = container.find_all(class_=re.compile(r'team|name', re.I))
+                team_elements = container.find_all(class_=_TEAM_CLASS_RE)
             
             # Extract time
-            time_elements = container.find_all(class_=re.compile(r'time|date|start', re.I))
+            time_elements = container.find_all(class_=_TIME_CLASS_RE)
             
             # This is a placeholder - actual parsing depends on HTML structure
             # For now, return None to indicate we couldn't parse
@@ -1,12 +1,25 @@
 """SQLite database operations"""
 import os
 import sqlite3
+import sys
+import threading
 from contextlib import contextmanager
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from .models import Match, Notification
+from ..utils.timezone import now_utc
+
+
+def _to_epoch(dt: datetime) -> int:
+    """Convert a naive UTC datetime to integer seconds since the epoch"""
+    return int(dt.replace(tzinfo=timezone.utc).timestamp())
+
+
+def _from_epoch(ts: int) -> datetime:
+    """Convert seconds since the epoch to a naive UTC datetime"""
+    return datetime.fromtimestamp(ts, tz=timezone.utc).replace(tzinfo=None)
 
 
 class Database:
@@ -39,8 +52,40 @@ class Database:
                 f"Try: chmod 777 data (or chown -R 1000:1000 data)"
             )
         
+        # One connection is shared for the life of the process; the lock
+        # serializes access from the event loop and worker threads
+        self._lock = threading.Lock()
+        self._conn = self._connect()
         self._init_db()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure the shared database connection"""
+        try:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")
+            return conn
+        except sqlite3.OperationalError as e:
+            error_msg = str(e)
+            if "unable to open database file" in error_msg.lower():
+                raise sqlite3.OperationalError(
+                    f"Cannot open database file '{self.db_path}': {e}\n"
+                    f"This is usually a permissions issue.\n"
+                    f"If running in Docker:\n"
+                    f"  1. Ensure the data directory exists: mkdir -p data\n"
+                    f"  2. Set proper permissions: chmod 777 data (or chown -R 1000:1000 data)\n"
+                    f"  3. Verify the volume mount in docker-compose.yml is correct"
+                ) from e
+            raise
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+    
     def _init_db(self):
         """Create tables if they don't exist"""
         with self._get_connection() as conn:
@@ -52,78 +97,141 @@ class Database:
                     id TEXT PRIMARY KEY,
                     home_team TEXT NOT NULL,
                     away_team TEXT NOT NULL,
-                    start_time_utc TEXT NOT NULL,
+                    start_time_utc INTEGER NOT NULL,
                     source TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
+                    created_at INTEGER NOT NULL,
                     url TEXT,
                     description TEXT
                 )
             """)
             
-            # Notifications table
+            # Notifications table; the primary key doubles as the covering
+            # index for the notification anti-join, so no rowid is needed
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS notifications (
                     match_id TEXT NOT NULL,
                     channel_id TEXT NOT NULL,
                     notified_at TEXT NOT NULL,
                     PRIMARY KEY (match_id, channel_id)
+                ) WITHOUT ROWID
+            """)
+            
+            # Key/value store for bookkeeping such as the last prune time
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS metadata (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
                 )
             """)
             
+            self._migrate_epoch_timestamps(conn)
+            self._migrate_notifications_without_rowid(conn)
+            
             # Indexes for performance
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_matches_start_time 
                 ON matches(start_time_utc)
             """)
             
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_notifications_match_id 
-                ON notifications(match_id)
-            """)
+            # Lookups by match_id are served by the primary key
+            cursor.execute("DROP INDEX IF EXISTS idx_notifications_match_id")
             
             conn.commit()
     
+    def _migrate_epoch_timestamps(self, conn: sqlite3.Connection):
+        """
+        Migrate matches from ISO-string timestamps to INTEGER epoch seconds
+        
+        Databases created before timestamps were stored as integers have
+        TEXT start_time_utc/created_at columns. SQLite can't change a
+        column's type in place, so the table is rebuilt.
+        """
+        columns = {
+            row['name']: row['type']
+            for row in conn.execute("PRAGMA table_info(matches)")
+        }
+        if columns.get('start_time_utc', '').upper() != 'TEXT':
+            return
+        
+        conn.executescript("""
+            BEGIN;
+            CREATE TABLE matches_new (
+                id TEXT PRIMARY KEY,
+                home_team TEXT NOT NULL,
+                away_team TEXT NOT NULL,
+                start_time_utc INTEGER NOT NULL,
+                source TEXT NOT NULL,
+                created_at INTEGER NOT NULL,
+                url TEXT,
+                description TEXT
+            );
+            INSERT INTO matches_new
+            SELECT id, home_team, away_team,
+                   CAST(strftime('%s', start_time_utc) AS INTEGER),
+                   source,
+                   CAST(strftime('%s', created_at) AS INTEGER),
+                   url, description
+            FROM matches;
+            DROP TABLE matches;
+            ALTER TABLE matches_new RENAME TO matches;
+            COMMIT;
+        """)
+    
+    def _migrate_notifications_without_rowid(self, conn: sqlite3.Connection):
+        """
+        Rebuild the notifications table as a WITHOUT ROWID table
+        
+        Older databases store notifications in a rowid table plus a separate
+        primary key index. Rebuilding keeps a single B-tree keyed on
+        (match_id, channel_id).
+        """
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'notifications'"
+        ).fetchone()
+        if row is None or 'WITHOUT ROWID' in row['sql'].upper():
+            return
+        
+        conn.executescript("""
+            BEGIN;
+            CREATE TABLE notifications_new (
+                match_id TEXT NOT NULL,
+                channel_id TEXT NOT NULL,
+                notified_at TEXT NOT NULL,
+                PRIMARY KEY (match_id, channel_id)
+            ) WITHOUT ROWID;
+            INSERT INTO notifications_new
+            SELECT match_id, channel_id, notified_at FROM notifications;
+            DROP TABLE notifications;
+            ALTER TABLE notifications_new RENAME TO notifications;
+            COMMIT;
+        """)
+    
     @contextmanager
     def _get_connection(self):
-        """Get database connection with context manager"""
-        try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
+        """Get the shared database connection, holding the lock while in use"""
+        with self._lock:
             try:
-                yield conn
-            finally:
-                conn.close()
-        except sqlite3.OperationalError as e:
-            error_msg = str(e)
-            if "unable to open database file" in error_msg.lower():
-                raise sqlite3.OperationalError(
-                    f"Cannot open database file '{self.db_path}': {e}\n"
-                    f"This is usually a permissions issue.\n"
-                    f"If running in Docker:\n"
-                    f"  1. Ensure the data directory exists: mkdir -p data\n"
-                    f"  2. Set proper permissions: chmod 777 data (or chown -R 1000:1000 data)\n"
-                    f"  3. Verify the volume mount in docker-compose.yml is correct"
-                ) from e
-            raise
+                yield self._conn
+            except Exception:
+                # Don't leave a half-finished transaction on the shared connection
+                self._conn.rollback()
+                raise
+    
+    _UPSERT_MATCH_SQL = """
+        INSERT OR REPLACE INTO matches 
+        (id, home_team, away_team, start_time_utc, source, created_at, url, description)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
     
     def upsert_match(self, match: Match):
         """Insert or update a match"""
+        self.upsert_matches((match,))
+    
+    def upsert_matches(self, matches: Iterable[Match]):
+        """Insert or update many matches in a single transaction"""
+        params = [self._match_to_params(match) for match in matches]
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO matches 
-                (id, home_team, away_team, start_time_utc, source, created_at, url, description)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                match.id,
-                match.home_team,
-                match.away_team,
-                match.start_time_utc.isoformat(),
-                match.source,
-                match.created_at.isoformat(),
-                match.url,
-                match.description
-            ))
+            conn.executemany(self._UPSERT_MATCH_SQL, params)
             conn.commit()
     
     def get_match(self, match_id: str) -> Optional[Match]:
@@ -144,35 +252,80 @@ class Database:
                 SELECT * FROM matches 
                 WHERE start_time_utc <= ?
                 ORDER BY start_time_utc ASC
-            """, (before_time.isoformat(),))
+            """, (_to_epoch(before_time),))
             return [self._row_to_match(row) for row in cursor.fetchall()]
     
     def get_matches_to_notify(
         self, 
         notification_time: datetime,
-        channel_id: str
+        channel_id: str,
+        before_time: Optional[datetime] = None
     ) -> List[Match]:
-        """Get matches that should be notified but haven't been yet"""
+        """
+        Get matches that should be notified but haven't been yet
+        
+        Args:
+            notification_time: Earliest start time to include
+            channel_id: Channel the notifications are sent to
+            before_time: Optional latest start time to include
+        
+        Returns:
+            Matches in the window with no notification for the channel
+        """
+        query = """
+            SELECT m.* FROM matches m
+            LEFT JOIN notifications n ON m.id = n.match_id AND n.channel_id = ?
+            WHERE m.start_time_utc >= ? 
+            AND n.match_id IS NULL
+        """
+        params = [channel_id, _to_epoch(notification_time)]
+        if before_time is not None:
+            query += " AND m.start_time_utc <= ?"
+            params.append(_to_epoch(before_time))
+        query += " ORDER BY m.start_time_utc ASC"
+        
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return [self._row_to_match(row) for row in cursor.fetchall()]
+    
+    def next_notification_time(
+        self,
+        after_time: datetime,
+        channel_id: str
+    ) -> Optional[datetime]:
+        """
+        Get the start time of the next match not yet notified for a channel
+        
+        Args:
+            after_time: Earliest start time to consider
+            channel_id: Channel the notifications are sent to
+        
+        Returns:
+            Earliest matching start time, or None if there are no such matches
+        """
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT m.* FROM matches m
+                SELECT MIN(m.start_time_utc) FROM matches m
                 LEFT JOIN notifications n ON m.id = n.match_id AND n.channel_id = ?
-                WHERE m.start_time_utc >= ? 
+                WHERE m.start_time_utc >= ?
                 AND n.match_id IS NULL
-                ORDER BY m.start_time_utc ASC
-            """, (channel_id, notification_time.isoformat()))
-            return [self._row_to_match(row) for row in cursor.fetchall()]
+            """, (channel_id, _to_epoch(after_time)))
+            row = cursor.fetchone()
+            if row and row[0] is not None:
+                return _from_epoch(row[0])
+            return None
     
     def mark_notified(self, match_id: str, channel_id: str):
-        """Mark a match as notified for a channel"""
+        """Mark a match as notified for a channel, keeping any earlier record"""
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                INSERT OR REPLACE INTO notifications 
+                INSERT OR IGNORE INTO notifications 
                 (match_id, channel_id, notified_at)
                 VALUES (?, ?, ?)
-            """, (match_id, channel_id, datetime.utcnow().isoformat()))
+            """, (match_id, channel_id, now_utc().isoformat()))
             conn.commit()
     
     def is_notified(self, match_id: str, channel_id: str) -> bool:
@@ -187,30 +340,58 @@ class Database:
     
     def prune_old_data(self, days: int = 30):
         """Remove matches and notifications older than specified days"""
-        cutoff = datetime.utcnow() - timedelta(days=days)
+        cutoff = now_utc() - timedelta(days=days)
         with self._get_connection() as conn:
             cursor = conn.cursor()
             # Delete old matches
             cursor.execute("""
                 DELETE FROM matches 
                 WHERE start_time_utc < ?
-            """, (cutoff.isoformat(),))
+            """, (_to_epoch(cutoff),))
             # Delete orphaned notifications
             cursor.execute("""
                 DELETE FROM notifications 
                 WHERE match_id NOT IN (SELECT id FROM matches)
             """)
+            # Record when we last pruned
+            cursor.execute("""
+                INSERT OR REPLACE INTO metadata (key, value)
+                VALUES ('last_prune_at', ?)
+            """, (now_utc().isoformat(),))
             conn.commit()
     
+    def get_last_prune_time(self) -> Optional[datetime]:
+        """Get when prune_old_data last ran, or None if it never has"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT value FROM metadata WHERE key = 'last_prune_at'")
+            row = cursor.fetchone()
+            if row:
+                return datetime.fromisoformat(row['value'])
+            return None
+    
+    def _match_to_params(self, match: Match) -> tuple:
+        """Convert Match object to upsert query parameters"""
+        return (
+            match.id,
+            match.home_team,
+            match.away_team,
+            _to_epoch(match.start_time_utc),
+            match.source,
+            _to_epoch(match.created_at),
+            match.url,
+            match.description
+        )
+    
     def _row_to_match(self, row: sqlite3.Row) -> Match:
         """Convert database row to Match object"""
         return Match(
             id=row['id'],
-            home_team=row['home_team'],
-            away_team=row['away_team'],
-            start_time_utc=datetime.fromisoformat(row['start_time_utc']),
-            source=row['source'],
-            created_at=datetime.fromisoformat(row['created_at']),
+            home_team=sys.intern(row['home_team']),
+            away_team=sys.intern(row['away_team']),
+            start_time_utc=_from_epoch(row['start_time_utc']),
+            source=sys.intern(row['source']),
+            created_at=_from_epoch(row['created_at']),
             url=row['url'],
             description=row['description']
         )
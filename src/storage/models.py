@@ -1,43 +1,28 @@
 """Data models for matches and notifications"""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Match:
-    """Represents a CDL match"""
+    """Represents a CDL match (matches are equal and hash by ID only)"""
     id: str
-    home_team: str
-    away_team: str
-    start_time_utc: datetime
-    source: str  # 'ics' or 'schedule'
-    created_at: datetime
-    url: Optional[str] = None
-    description: Optional[str] = None
-    
-    def __hash__(self):
-        return hash(self.id)
-    
-    def __eq__(self, other):
-        if not isinstance(other, Match):
-            return False
-        return self.id == other.id
+    home_team: str = field(compare=False)
+    away_team: str = field(compare=False)
+    start_time_utc: datetime = field(compare=False)
+    source: str = field(compare=False)  # 'ics' or 'schedule'
+    created_at: datetime = field(compare=False)
+    url: Optional[str] = field(default=None, compare=False)
+    description: Optional[str] = field(default=None, compare=False)
+    # Lowercased, whitespace-normalized team names (set by MatchService)
+    home_norm: str = field(default="", repr=False, compare=False)
+    away_norm: str = field(default="", repr=False, compare=False)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Notification:
-    """Represents a sent notification"""
+    """Represents a sent notification (keyed by match and channel)"""
     match_id: str
     channel_id: str
-    notified_at: datetime
-    
-    def __hash__(self):
-        return hash((self.match_id, self.channel_id))
-    
-    def __eq__(self, other):
-        if not isinstance(other, Notification):
-            return False
-        return (self.match_id == other.match_id and 
-                self.channel_id == other.channel_id)
-
+    notified_at: datetime = field(compare=False)
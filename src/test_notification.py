@@ -7,9 +7,8 @@ from datetime import datetime, timedelta
 from .config import Config
 from .storage.database import Database
 from .storage.models import Match
-from .services.discord_client import DiscordClient
-from .services.ics_parser import ICSParser
 from .utils.logger import setup_logger
+from .utils.match_id import generate_match_id
 from .utils.timezone import now_utc
 
 logger = setup_logger(__name__)
@@ -33,9 +32,8 @@ def create_test_match(
     Returns:
         Match object
     """
-    # Use ICSParser to generate a valid match ID
-    parser = ICSParser("")
-    match_id = parser._generate_match_id(team1, team2, start_time)
+    # Generate the ID the same way the ICS parser does
+    match_id = generate_match_id(team1, team2, start_time)
     
     return Match(
         id=match_id,
@@ -62,6 +60,9 @@ async def test_immediate_notification(
         team2: Second team name
         config: Configuration object
     """
+    # Only the immediate mode needs discord.py
+    from .services.discord_client import DiscordClient
+    
     logger.info("Testing immediate notification mode...")
     
     # Create test match with start time 1 minute from now
@@ -69,8 +70,8 @@ async def test_immediate_notification(
     match = create_test_match(team1, team2, start_time)
     
     logger.info(
-        f"Created test match: {match.home_team} vs {match.away_team} "
-        f"(starts at {match.start_time_utc})"
+        "Created test match: %s vs %s (starts at %s)",
+        match.home_team, match.away_team, match.start_time_utc
     )
     
     # Initialize Discord client
@@ -78,34 +79,29 @@ async def test_immediate_notification(
         token=config.discord_bot_token,
         channel_id=config.discord_channel_id,
         mention_role_id=config.discord_mention_role_id,
+        mention_role_name=config.discord_mention_role_name,
         ping_everyone=config.discord_ping_everyone
     )
     
-    # Start Discord client
-    discord_task = asyncio.create_task(discord_client.start())
-    
-    # Wait for Discord to connect
+    # Connect to Discord, send the notification and disconnect
     logger.info("Connecting to Discord...")
-    await asyncio.sleep(3)
-    
     try:
-        # Send notification
-        logger.info("Sending test notification...")
-        success = await discord_client.send_notification(match)
-        
-        if success:
-            logger.info("✓ Test notification sent successfully!")
-        else:
-            logger.error("✗ Failed to send test notification")
-            sys.exit(1)
-    finally:
-        # Clean up
-        await discord_client.close()
-        discord_task.cancel()
-        try:
-            await discord_task
-        except asyncio.CancelledError:
-            pass
+        async with discord_client:
+            logger.info("Sending test notification...")
+            success = await discord_client.send_notification(match)
+    except asyncio.TimeoutError:
+        logger.error("✗ Timed out connecting to Discord")
+        sys.exit(1)
+    except Exception as e:
+        # e.g. discord.LoginFailure for a bad token
+        logger.error("✗ Failed to connect to Discord: %s", e)
+        sys.exit(1)
+    
+    if success:
+        logger.info("✓ Test notification sent successfully!")
+    else:
+        logger.error("✗ Failed to send test notification")
+        sys.exit(1)
 
 
 def test_scheduled_notification(
@@ -123,28 +119,37 @@ def test_scheduled_notification(
         minutes: Minutes from now to set match start time
         config: Configuration object
     """
-    logger.info(f"Testing scheduled notification mode (match starts in {minutes} minutes)...")
+    logger.info("Testing scheduled notification mode (match starts in %d minutes)...", minutes)
     
     # Create test match with start time N minutes from now
     start_time = now_utc() + timedelta(minutes=minutes)
     match = create_test_match(team1, team2, start_time)
     
     logger.info(
-        f"Created test match: {match.home_team} vs {match.away_team} "
-        f"(starts at {match.start_time_utc})"
+        "Created test match: %s vs %s (starts at %s)",
+        match.home_team, match.away_team, match.start_time_utc
     )
     
     # Store in database
     database = Database(db_path="data/bot.db")
     database.upsert_match(match)
+    database.close()
+    
+    notify_at = start_time - timedelta(minutes=config.notify_minutes_before)
     
-    logger.info(f"✓ Test match stored in database (ID: {match.id})")
-    logger.info("")
-    logger.info("Next steps:")
-    logger.info("1. Start the main bot: python -m src.main")
-    logger.info(f"2. Wait for the notification service to pick up the match")
-    logger.info(f"   (notification will be sent {config.notify_minutes_before} minutes before start time)")
-    logger.info(f"3. Expected notification time: {start_time - timedelta(minutes=config.notify_minutes_before)}")
+    logger.info("✓ Test match stored in database (ID: %s)", match.id)
+    logger.info(
+        "\n".join([
+            "",
+            "Next steps:",
+            "1. Start the main bot: python -m src.main",
+            "2. Wait for the notification service to pick up the match",
+            "   (notification will be sent %d minutes before start time)",
+            "3. Expected notification time: %s",
+        ]),
+        config.notify_minutes_before,
+        notify_at
+    )
 
 
 def main():
@@ -182,7 +187,7 @@ def main():
     try:
         config = Config()
     except ValueError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         sys.exit(1)
     
     if args.immediate:
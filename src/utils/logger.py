@@ -1,8 +1,37 @@
 """Logging configuration"""
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Optional
 
+# Records from every logger go through this queue and are written to stdout
+# by a background thread, so logging never blocks the event loop on I/O
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _start_listener():
+    """Start the background thread that writes queued records to stdout"""
+    global _listener
+    if _listener is not None:
+        return
+    
+    handler = logging.StreamHandler(sys.stdout)
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    handler.setFormatter(formatter)
+    
+    _listener = logging.handlers.QueueListener(
+        _log_queue, handler, respect_handler_level=True
+    )
+    _listener.start()
+    # Drain anything still queued before the interpreter exits
+    atexit.register(_listener.stop)
+
 
 def setup_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     """Set up and return a logger instance"""
@@ -12,14 +41,8 @@ def setup_logger(name: str, level: Optional[int] = None) -> logging.Logger:
         level = logging.INFO
     
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        _start_listener()
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
         logger.setLevel(level)
     
     return logger
-
@@ -0,0 +1,40 @@
+"""Match ID generation"""
+import hashlib
+from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def generate_match_id(home_team: str, away_team: str, start_time: datetime) -> str:
+    """
+    Generate a unique match ID
+    
+    The ID depends only on the two team names (case-insensitive, in either
+    order) and the match date, so the same match from different sources
+    maps to the same ID.
+    
+    Args:
+        home_team: Home team name
+        away_team: Away team name
+        start_time: Match start time
+    
+    Returns:
+        Unique match ID string
+    """
+    # Normalize team names for ID generation
+    normalized_home = home_team.lower().strip()
+    normalized_away = away_team.lower().strip()
+    
+    # Use alphabetical order for consistent IDs regardless of home/away
+    team_pair = tuple(sorted([normalized_home, normalized_away]))
+    
+    # Include date (not time) for uniqueness
+    date_str = start_time.strftime("%Y-%m-%d")
+    
+    # Generate hash. MD5 is kept because the IDs are persisted: changing
+    # the hash would orphan stored matches and re-send notifications.
+    # It is only an identifier, so skip the security-policy checks.
+    content = f"{team_pair[0]}|{team_pair[1]}|{date_str}"
+    match_id = hashlib.md5(content.encode(), usedforsecurity=False).hexdigest()[:16]
+    
+    return f"match_{match_id}"
@@ -1,12 +1,18 @@
 """Team ID loader from ICS links file"""
+import logging
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Tuple
 
 from .logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Team ID before .ics, e.g. ".../team_id.ics" or ".../team_id.ics?params"
+_TEAM_ID_RE = re.compile(r'/([^/]+)\.ics')
+
 
 def parse_ics_links_file(file_path: str) -> List[str]:
     """
@@ -22,51 +28,85 @@ def parse_ics_links_file(file_path: str) -> List[str]:
     Returns:
         List of team IDs extracted from URLs
     """
+    # Only re-read the file when its mtime changes
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except OSError:
+        return _parse_ics_links_file(file_path)
+    
+    return list(_parse_ics_links_file_cached(file_path, mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _parse_ics_links_file_cached(file_path: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Memoized parse of an ICS links file, keyed by path and mtime"""
+    return tuple(_parse_ics_links_file(file_path))
+
+
+def _parse_ics_links_file(file_path: str) -> List[str]:
+    """Read and parse an ICS links file (see parse_ics_links_file)"""
     team_ids = []
     file = Path(file_path)
     
     if not file.exists():
-        logger.warning(f"ICS links file not found: {file_path}")
+        logger.warning("ICS links file not found: %s", file_path)
         return team_ids
     
     try:
-        with open(file, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                
-                # Skip empty lines
-                if not line:
-                    continue
-                
-                # Check if line has the expected format (Team Name: URL)
-                if ':' not in line:
-                    logger.warning(f"Line {line_num} in {file_path} doesn't contain ':' - skipping: {line}")
-                    continue
-                
-                # Split on first colon to separate team name from URL
-                parts = line.split(':', 1)
-                if len(parts) != 2:
-                    logger.warning(f"Line {line_num} in {file_path} has unexpected format - skipping: {line}")
-                    continue
-                
-                url = parts[1].strip()
-                
-                # Extract team ID from URL
-                team_id = _extract_team_id_from_url(url)
-                if team_id:
-                    team_ids.append(team_id)
-                    logger.debug(f"Extracted team ID '{team_id}' from line {line_num}")
-                else:
-                    logger.warning(f"Could not extract team ID from URL on line {line_num}: {url}")
+        # The file is only a few KB, so read it in one go and parse in memory
+        text = file.read_text(encoding='utf-8')
+        team_ids.extend(_iter_team_ids(text.splitlines(), file_path))
         
-        logger.info(f"Parsed {len(team_ids)} team ID(s) from {file_path}")
+        logger.info("Parsed %d team ID(s) from %s", len(team_ids), file_path)
         return team_ids
     
     except Exception as e:
-        logger.error(f"Error reading ICS links file {file_path}: {e}")
+        logger.error("Error reading ICS links file %s: %s", file_path, e)
         return team_ids
 
 
+def _iter_team_ids(lines: Iterable[str], file_path: str) -> Iterator[str]:
+    """
+    Yield team IDs from the lines of an ICS links file
+    
+    Args:
+        lines: Lines of the file
+        file_path: Path of the file, for log messages
+        
+    Yields:
+        Team IDs in file order
+    """
+    # Checked once so per-line debug messages aren't formatted when unused
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+        
+        # Skip empty lines
+        if not line:
+            continue
+        
+        # Split on first colon to separate team name from URL
+        # (expected format: Team Name: URL)
+        _, sep, url = line.partition(':')
+        if not sep:
+            logger.warning(
+                "Line %d in %s doesn't contain ':' - skipping: %s", line_num, file_path, line
+            )
+            continue
+        
+        url = url.strip()
+        
+        # Extract team ID from URL
+        team_id = _extract_team_id_from_url(url)
+        if team_id:
+            if debug_enabled:
+                logger.debug("Extracted team ID '%s' from line %d", team_id, line_num)
+            yield team_id
+        else:
+            logger.warning("Could not extract team ID from URL on line %d: %s", line_num, url)
+
+
 def _extract_team_id_from_url(url: str) -> str:
     """
     Extract team ID from ICS URL
@@ -82,16 +122,30 @@ def _extract_team_id_from_url(url: str) -> str:
     Returns:
         Team ID string, or empty string if extraction fails
     """
-    # Normalize webcal:// to https:// for easier parsing
-    normalized_url = url.replace("webcal://", "https://", 1)
-    
-    # Pattern to match team ID before .ics
-    # Matches: .../team_id.ics or .../team_id.ics?params
-    pattern = r'/([^/]+)\.ics'
-    match = re.search(pattern, normalized_url)
+    # The pattern only looks at the path, so the scheme doesn't matter
+    match = _TEAM_ID_RE.search(url)
     
     if match:
         return match.group(1)
     
     return ""
 
+
+def build_ics_url(base_url: str, team_id: str) -> str:
+    """
+    Build the https:// ICS feed URL for a team
+    
+    Args:
+        base_url: Base URL for CDL ICS feeds (webcal:// or https://)
+        team_id: Team identifier (e.g., 'blt19237b20a0dd1b07')
+        
+    Returns:
+        Feed URL string
+    """
+    url = f"{base_url.rstrip('/')}/{team_id}.ics"
+    
+    # Convert webcal:// to https://
+    if url.startswith("webcal://"):
+        url = url.replace("webcal://", "https://", 1)
+    
+    return url
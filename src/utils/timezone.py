@@ -1,7 +1,16 @@
 """Timezone conversion utilities"""
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
-import pytz
+from zoneinfo import ZoneInfo
+
+_UTC = timezone.utc
+
+
+@lru_cache(maxsize=64)
+def _get_tz(name: str) -> ZoneInfo:
+    """Look up a timezone by name, memoized"""
+    return ZoneInfo(name)
 
 
 def to_utc(dt: datetime, tz: Optional[str] = None) -> datetime:
@@ -17,18 +26,19 @@ def to_utc(dt: datetime, tz: Optional[str] = None) -> datetime:
         Datetime object in UTC
     """
     if dt.tzinfo is None:
-        if tz:
-            # Naive datetime, assume it's in the specified timezone
-            tz_obj = pytz.timezone(tz)
-            dt = tz_obj.localize(dt)
-        else:
-            # Naive datetime, assume UTC
-            dt = pytz.UTC.localize(dt)
+        if not tz:
+            # Naive datetime, assume it's already UTC
+            return dt
+        # Naive datetime, assume it's in the specified timezone
+        dt = dt.replace(tzinfo=_get_tz(tz))
+    elif dt.utcoffset() == timedelta(0):
+        # Already UTC, just drop the tzinfo
+        return dt.replace(tzinfo=None)
     
-    return dt.astimezone(pytz.UTC).replace(tzinfo=None)
+    return dt.astimezone(_UTC).replace(tzinfo=None)
 
 
 def now_utc() -> datetime:
     """Get current UTC time as naive datetime"""
-    return datetime.utcnow()
+    return datetime.now(_UTC).replace(tzinfo=None)
 
@@ -0,0 +1,57 @@
+"""Tests for the streaming ICS parser"""
+import unittest
+from pathlib import Path
+
+from icalendar import Calendar
+
+from src.services.ics_parser import ICSParser
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _fields(matches):
+    """Comparable fields of parsed matches, ignoring parse time"""
+    return [
+        (m.id, m.home_team, m.away_team, m.start_time_utc, m.url, m.description)
+        for m in matches
+    ]
+
+
+class FastParseTest(unittest.TestCase):
+    """The streaming parser must agree with the icalendar-based parser"""
+    
+    def setUp(self):
+        self.parser = ICSParser("")
+        self.content = (FIXTURES / "cdl_sample.ics").read_text(encoding="utf-8")
+    
+    def _icalendar_parse(self, content):
+        calendar = Calendar.from_ical(content)
+        matches = [self.parser._parse_event(event, "ics") for event in calendar.walk("VEVENT")]
+        return [match for match in matches if match]
+    
+    def test_matches_icalendar(self):
+        fast = self.parser._fast_parse_ics(self.content, "ics")
+        self.assertEqual(len(fast), 3)
+        self.assertEqual(_fields(fast), _fields(self._icalendar_parse(self.content)))
+    
+    def test_component_names_are_case_insensitive(self):
+        content = (
+            self.content
+            .replace("BEGIN:VEVENT", "Begin:VEvent")
+            .replace("END:VEVENT", "End:VEvent")
+            .replace("BEGIN:VALARM", "begin:valarm")
+            .replace("END:VALARM", "end:valarm")
+        )
+        fast = self.parser._fast_parse_ics(content, "ics")
+        self.assertEqual(len(fast), 3)
+        self.assertEqual(_fields(fast), _fields(self._icalendar_parse(content)))
+    
+    def test_parse_ics_uses_fast_path_results(self):
+        self.assertEqual(
+            _fields(self.parser.parse_ics(self.content)),
+            _fields(self.parser._fast_parse_ics(self.content, "ics"))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()